@@ -2,7 +2,6 @@ import os
 import signal
 import subprocess
 from contextlib import contextmanager
-import time
 from warnings import warn
 from pathlib import Path
 import atexit
@@ -18,12 +17,25 @@ os.environ["NODE_OPTIONS"] = f"--max_old_space_size={MAX_SPACE_NPM}"
 
 # Function to clean up background processes
 def cleanup(pro: subprocess.Popen):
+    if pro.poll() is not None:
+        return  # Already exited
     print("Cleaning up background processes...")
-    pro.terminate()  # Attempt graceful termination
+    # uvicorn runs in its own session, so one killpg reaches the master and all workers
+    try:
+        os.killpg(os.getpgid(pro.pid), signal.SIGTERM)  # Attempt graceful termination
+    except ProcessLookupError:
+        return
     try:
         pro.wait(timeout=5)  # Wait up to 5 seconds for process to terminate
     except subprocess.TimeoutExpired:
-        pro.kill()  # Force kill if not terminated after timeout
+        try:
+            os.killpg(os.getpgid(pro.pid), signal.SIGKILL)  # Force kill if not terminated after timeout
+        except ProcessLookupError:
+            pass
+
+
+def _raise_keyboard_interrupt(signum, frame) -> None:
+    raise KeyboardInterrupt
 
 
 # Context manager to handle process start and cleanup
@@ -36,6 +48,8 @@ def run_background_process() -> subprocess.Popen:  # type: ignore
 
         # Start background processes
         port = os.environ.get("PORT", "80")
+        # Stay at 1 worker by default: power maps, stakeholders and OAuth state live
+        # in per-process dicts, so extra workers would not see each other's data.
         workers = os.environ.get("WEB_CONCURRENCY", "1")  # Render free tier: use 1 worker
 
         print(f"Starting uvicorn on port {port} with {workers} workers...")
@@ -50,11 +64,24 @@ def run_background_process() -> subprocess.Popen:  # type: ignore
                 "--workers",
                 workers,
                 "--forwarded-allow-ips=*",
+                "--limit-concurrency",
+                "1000",
+                "--backlog",
+                "2048",
+                "--proxy-headers",
+                # uvloop + httptools come from uvicorn[standard]
+                "--loop",
+                "uvloop",
+                "--http",
+                "httptools",
                 f"{APP_NAME}.app:app",
-            ]
+            ],
+            start_new_session=True,
+            close_fds=True,
         )
-        # Trap SIGINT (Ctrl-C) to call the cleanup function
-        signal.signal(signal.SIGINT, lambda signum, frame: lambda: cleanup(pro))
+        # Ctrl-C: only interrupt the main wait; the finally below reaps the process group.
+        # Waiting on pro inside the handler would block on Popen's waitpid lock.
+        signal.signal(signal.SIGINT, _raise_keyboard_interrupt)
         yield pro
     finally:
         if pro:
@@ -90,8 +117,8 @@ def run_background_tasks() -> None:
             data.append(proc)
         else:
             data[0] = proc
-        while proc.poll() is None:
-            time.sleep(1)
+        # Block in waitpid() until the worker exits instead of polling every second
+        proc.wait()
 
 
 def main() -> None:
@@ -10,11 +10,11 @@ from fastapi_cache import FastAPICache
 
 from subtext.init_app import app
 from subtext.init_frontend_app import init_frontend_app
-from subtext.memory_cache import SharedMemoryData, create_shared_memory
+from subtext.memory_cache import SharedMemoryData, create_shared_memory, release_shared_memory
 from subtext.settings import IS_TEST
 from subtext.routes import power_map, stakeholders, analyzer, calendar, automated_power_map, oauth
 
-SHARED_MEMORY = create_shared_memory(owner=False)
+SHARED_MEMORY = create_shared_memory()
 
 
 def load_shared_memory() -> SharedMemoryData:
@@ -36,6 +36,11 @@ async def startup():
     FastAPICache.init("fastapi-cache")
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    release_shared_memory(SHARED_MEMORY)
+
+
 @app.get("/api/health", include_in_schema=IS_TEST)
 async def health() -> PlainTextResponse:
     return PlainTextResponse(content="OK", status_code=200)
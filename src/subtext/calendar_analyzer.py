@@ -3,9 +3,11 @@ Calendar Analyzer - AI-powered strategic calendar analysis
 Cross-references calendar events with stakeholder database
 """
 
+import re
 import uuid
 import json
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 from subtext.models import (
@@ -15,6 +17,34 @@ from subtext.models import (
 )
 from subtext.llm_service import llm_service
 
+# Per-meeting analysis is dominated by the Claude round trip, so run meetings in parallel.
+# A dedicated pool: analyze_calendar itself already runs on the asyncwrap executor.
+MEETING_CONCURRENCY = 8
+_MEETING_EXECUTOR = ThreadPoolExecutor(max_workers=MEETING_CONCURRENCY, thread_name_prefix="meeting")
+
+# Meeting-title keyword triggers (substring match, like the old `in title.lower()` checks)
+_BRAINSTORM_RE = re.compile(r"brainstorm|ideation", re.IGNORECASE)
+_REVIEW_RE = re.compile(r"review", re.IGNORECASE)
+_REVIEW_OR_UPDATE_RE = re.compile(r"review|update", re.IGNORECASE)
+_PLANNING_RE = re.compile(r"planning|strategy", re.IGNORECASE)
+
+_HIGH_STAKES = frozenset({PoliticalStakesLevel.HIGH, PoliticalStakesLevel.CRITICAL})
+
+
+class StakeholderIndex:
+    """
+    Stakeholder names lowercased once per analysis, plus a memo of attendee matches
+    The same people show up in most meetings, so each attendee is only matched once
+    """
+
+    def __init__(self, stakeholders: List[Stakeholder]):
+        # (lowercased name, lowercased name parts, stakeholder)
+        self.entries: List[Tuple[str, Tuple[str, ...], Stakeholder]] = []
+        for stakeholder in stakeholders:
+            name_lower = stakeholder.name.lower()
+            self.entries.append((name_lower, tuple(name_lower.split()), stakeholder))
+        self.matches: Dict[str, Optional[Stakeholder]] = {}
+
 
 class CalendarAnalyzer:
     """
@@ -42,21 +72,37 @@ class CalendarAnalyzer:
             CalendarAnalysis with meeting insights and warnings
         """
 
-        # Analyze each meeting
-        meeting_insights = []
-        for event in events:
-            insight = self._analyze_meeting(
+        # Lowercase stakeholder names once instead of per attendee per meeting
+        stakeholder_index = StakeholderIndex(stakeholders)
+
+        # Resolve the manager once rather than scanning stakeholders per meeting
+        manager_stakeholder = None
+        if user_manager_name:
+            manager_name_lower = user_manager_name.lower()
+            manager_stakeholder = next(
+                (s for name_lower, _, s in stakeholder_index.entries if name_lower == manager_name_lower),
+                None
+            )
+
+        # Analyze each meeting (in parallel - results keep the event order)
+        def analyze(event: CalendarEvent) -> MeetingInsight:
+            return self._analyze_meeting(
                 event=event,
                 stakeholders=stakeholders,
-                user_manager_name=user_manager_name
+                stakeholder_index=stakeholder_index,
+                manager_stakeholder=manager_stakeholder
             )
-            meeting_insights.append(insight)
+
+        if len(events) > 1:
+            meeting_insights = list(_MEETING_EXECUTOR.map(analyze, events))
+        else:
+            meeting_insights = [analyze(event) for event in events]
 
         # Calculate summary stats
         total_meetings = len(meeting_insights)
         high_stakes_count = sum(
             1 for m in meeting_insights
-            if m.political_stakes in [PoliticalStakesLevel.HIGH, PoliticalStakesLevel.CRITICAL]
+            if m.political_stakes in _HIGH_STAKES
         )
 
         # Generate weekly summary using LLM
@@ -78,22 +124,26 @@ class CalendarAnalyzer:
         self,
         event: CalendarEvent,
         stakeholders: List[Stakeholder],
-        user_manager_name: Optional[str] = None
+        stakeholder_index: StakeholderIndex,
+        manager_stakeholder: Optional[Stakeholder] = None
     ) -> MeetingInsight:
         """Analyze a single meeting for political implications"""
 
         # Cross-reference attendees with stakeholders
         matched_stakeholders = []
+        matched_objects: Dict[str, Stakeholder] = {}  # by id, in attendee order
         total_influence = 0
         adversary_count = 0
         ally_count = 0
         manager_present = False
+        manager_name = manager_stakeholder.name.lower() if manager_stakeholder else None
 
         for attendee in event.attendees:
             # Try to match by name or email
-            matched = self._find_stakeholder_match(attendee, stakeholders)
+            matched = self._find_stakeholder_match(attendee, stakeholder_index)
             if matched:
                 matched_stakeholders.append(matched.id)
+                matched_objects.setdefault(matched.id, matched)
                 total_influence += matched.influence_level
 
                 if matched.relationship_status == RelationshipStatus.ADVERSARY:
@@ -101,7 +151,7 @@ class CalendarAnalyzer:
                 elif matched.relationship_status == RelationshipStatus.ALLY:
                     ally_count += 1
 
-                if user_manager_name and matched.name.lower() == user_manager_name.lower():
+                if manager_name and matched.name.lower() == manager_name:
                     manager_present = True
 
         # Calculate political stakes
@@ -123,18 +173,13 @@ class CalendarAnalyzer:
 
         # Get manager tips if manager is present
         manager_tips = None
-        if manager_present and user_manager_name:
-            manager_stakeholder = next(
-                (s for s in stakeholders if s.name.lower() == user_manager_name.lower()),
-                None
-            )
-            if manager_stakeholder:
-                manager_tips = self._generate_manager_tips(manager_stakeholder, event)
+        if manager_present and manager_stakeholder:
+            manager_tips = self._generate_manager_tips(manager_stakeholder, event)
 
         # Generate preparation advice using LLM
         preparation_advice = self._generate_preparation_advice(
             event=event,
-            matched_stakeholders=[s for s in stakeholders if s.id in matched_stakeholders],
+            matched_stakeholders=list(matched_objects.values()),
             political_stakes=political_stakes,
             adversary_count=adversary_count,
             ally_count=ally_count
@@ -143,7 +188,7 @@ class CalendarAnalyzer:
         # Generate talking points
         talking_points = self._generate_talking_points(
             event=event,
-            matched_stakeholders=[s for s in stakeholders if s.id in matched_stakeholders],
+            matched_stakeholders=list(matched_objects.values()),
             political_stakes=political_stakes
         )
 
@@ -163,25 +208,32 @@ class CalendarAnalyzer:
     def _find_stakeholder_match(
         self,
         attendee: str,
-        stakeholders: List[Stakeholder]
+        stakeholder_index: StakeholderIndex
     ) -> Optional[Stakeholder]:
         """Match an attendee email/name to a stakeholder"""
+        if attendee in stakeholder_index.matches:
+            return stakeholder_index.matches[attendee]
+
         attendee_lower = attendee.lower()
+        match = None
 
-        for stakeholder in stakeholders:
+        for name_lower, name_parts, stakeholder in stakeholder_index.entries:
             # Match by exact name
-            if stakeholder.name.lower() in attendee_lower:
-                return stakeholder
+            if name_lower in attendee_lower:
+                match = stakeholder
+                break
 
             # Match by name parts (first/last name)
-            name_parts = stakeholder.name.lower().split()
             if all(part in attendee_lower for part in name_parts):
-                return stakeholder
+                match = stakeholder
+                break
 
-        return None
+        # Meetings run on several threads; a racing duplicate write stores the same value
+        stakeholder_index.matches[attendee] = match
+        return match
 
+    @staticmethod
     def _calculate_political_stakes(
-        self,
         total_influence: int,
         stakeholder_count: int,
         adversary_count: int
@@ -252,7 +304,7 @@ class CalendarAnalyzer:
             ))
 
         # Unstructured meeting opportunity
-        if "brainstorm" in event.title.lower() or "ideation" in event.title.lower():
+        if _BRAINSTORM_RE.search(event.title):
             warnings.append(MeetingWarning(
                 type="opportunity",
                 message="💡 Brainstorming session - opportunity to gain credit by contributing valuable ideas. Prepare 2-3 concrete suggestions.",
@@ -286,10 +338,10 @@ class CalendarAnalyzer:
         # Generic tips based on role
         tips.append("Have specific data/examples ready - managers appreciate concrete information")
 
-        if "review" in event.title.lower() or "update" in event.title.lower():
+        if _REVIEW_OR_UPDATE_RE.search(event.title):
             tips.append("Prepare a concise update on your progress and any blockers")
 
-        if "planning" in event.title.lower() or "strategy" in event.title.lower():
+        if _PLANNING_RE.search(event.title):
             tips.append("Come with 1-2 strategic suggestions to demonstrate initiative")
 
         return " | ".join(tips)
@@ -304,8 +356,8 @@ class CalendarAnalyzer:
     ) -> str:
         """Generate AI-powered preparation advice using LLM"""
 
-        # If no LLM available, return generic advice
-        if not llm_service.client:
+        # If no LLM available (unconfigured or circuit open), or no known stakeholders, return generic advice
+        if not llm_service.available or not matched_stakeholders:
             return self._generic_preparation_advice(event, political_stakes, adversary_count, ally_count)
 
         # Build stakeholder context
@@ -315,11 +367,14 @@ class CalendarAnalyzer:
                 f"- {s.name} ({s.role}): {s.relationship_status.value}, influence {s.influence_level}/10"
             )
 
+        # total_seconds(): .seconds ignores the days part of multi-day events
+        duration_minutes = int((event.end_time - event.start_time).total_seconds() // 60)
+
         prompt = f"""You are an expert executive coach helping someone prepare for a meeting.
 
 **Meeting:** {event.title}
 **When:** {event.start_time.strftime('%A, %B %d at %I:%M %p')}
-**Duration:** {(event.end_time - event.start_time).seconds // 60} minutes
+**Duration:** {duration_minutes} minutes
 **Political Stakes:** {political_stakes.value.upper()}
 
 **Attendees ({len(matched_stakeholders)} stakeholders identified):**
@@ -338,12 +393,8 @@ Provide concise, actionable preparation advice (2-3 sentences). Focus on:
 Keep it practical and corporate-appropriate."""
 
         try:
-            message = llm_service.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=300,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return message.content[0].text.strip()
+            # Cached by prompt - re-analyzing an unchanged calendar skips the API call
+            return llm_service.complete(prompt, max_tokens=300).strip()
         except Exception as e:
             print(f"Error generating LLM advice: {e}")
             return self._generic_preparation_advice(event, political_stakes, adversary_count, ally_count)
@@ -358,15 +409,15 @@ Keep it practical and corporate-appropriate."""
 
         points = []
 
-        if political_stakes in [PoliticalStakesLevel.HIGH, PoliticalStakesLevel.CRITICAL]:
+        if political_stakes in _HIGH_STAKES:
             points.append("Lead with data and facts to establish credibility")
             points.append("Acknowledge others' concerns before presenting your view")
 
-        if "review" in event.title.lower():
+        if _REVIEW_RE.search(event.title):
             points.append("Highlight measurable achievements and outcomes")
             points.append("Frame challenges as learning opportunities")
 
-        if "planning" in event.title.lower() or "strategy" in event.title.lower():
+        if _PLANNING_RE.search(event.title):
             points.append("Connect proposals to team/company goals")
             points.append("Address potential risks proactively")
 
@@ -385,7 +436,7 @@ Keep it practical and corporate-appropriate."""
     ) -> str:
         """Generate a strategic summary of the week using LLM"""
 
-        if not llm_service.client or not meeting_insights:
+        if not llm_service.available or not meeting_insights:
             return self._generic_weekly_summary(meeting_insights)
 
         # Build summary of meetings
@@ -398,7 +449,7 @@ Keep it practical and corporate-appropriate."""
         prompt = f"""You are an executive coach providing a strategic weekly briefing.
 
 **Upcoming Meetings:** {len(meeting_insights)}
-**High-Stakes Meetings:** {sum(1 for m in meeting_insights if m.political_stakes in [PoliticalStakesLevel.HIGH, PoliticalStakesLevel.CRITICAL])}
+**High-Stakes Meetings:** {sum(1 for m in meeting_insights if m.political_stakes in _HIGH_STAKES)}
 
 **Schedule:**
 {chr(10).join(meetings_summary)}
@@ -411,12 +462,7 @@ Provide a 2-3 sentence strategic summary for the week ahead. Focus on:
 Keep it executive-level and actionable."""
 
         try:
-            message = llm_service.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=200,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return message.content[0].text.strip()
+            return llm_service.complete(prompt, max_tokens=200).strip()
         except Exception as e:
             print(f"Error generating weekly summary: {e}")
             return self._generic_weekly_summary(meeting_insights)
@@ -446,7 +492,7 @@ Keep it executive-level and actionable."""
 
         high_stakes = sum(
             1 for m in meeting_insights
-            if m.political_stakes in [PoliticalStakesLevel.HIGH, PoliticalStakesLevel.CRITICAL]
+            if m.political_stakes in _HIGH_STAKES
         )
 
         if high_stakes >= 3:
@@ -5,27 +5,34 @@ Supports both iCal feed URLs and Google Calendar API
 
 import os
 import uuid
+import importlib.util
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 import re
 
+import orjson
+
 from subtext.models import CalendarEvent
 
 # Optional imports for calendar parsing
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
     print("Warning: requests package not installed. Calendar fetching disabled.")
 
-try:
-    from icalendar import Calendar
-    ICALENDAR_AVAILABLE = True
-except ImportError:
-    ICALENDAR_AVAILABLE = False
+# icalendar is only imported when an iCal feed is actually fetched
+ICALENDAR_AVAILABLE = importlib.util.find_spec("icalendar") is not None
+if not ICALENDAR_AVAILABLE:
     print("Warning: icalendar package not installed. iCal parsing disabled.")
 
+_MAILTO_RE = re.compile(r'mailto:(\S+)', re.IGNORECASE)
+# Reminder blocks are never used - drop them before icalendar builds its object tree
+_STRIP_ALARM_RE = re.compile(rb'BEGIN:VALARM\r?\n.*?END:VALARM\r?\n', re.DOTALL)
+
 
 class CalendarService:
     """
@@ -37,6 +44,17 @@ class CalendarService:
         """Initialize calendar service"""
         self.google_client_id = os.environ.get("GOOGLE_CLIENT_ID")
         self.google_client_secret = os.environ.get("GOOGLE_CLIENT_SECRET")
+        self._session = self._create_session() if REQUESTS_AVAILABLE else None
+
+    @staticmethod
+    def _create_session():
+        """Keep-alive HTTP session shared by all calendar fetches"""
+        session = requests.Session()
+        retry = Retry(total=2, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def fetch_ical_events(
         self,
@@ -57,24 +75,29 @@ class CalendarService:
             print("⚠️ Calendar libraries not available")
             return self._mock_calendar_events(days_ahead)
 
+        from icalendar import Calendar
+
         try:
             # Fetch the iCal feed
-            response = requests.get(ical_url, timeout=10)
+            response = self._session.get(ical_url, timeout=10)
             response.raise_for_status()
 
             # Parse the iCal data
-            cal = Calendar.from_ical(response.content)
+            cal = Calendar.from_ical(_STRIP_ALARM_RE.sub(b'', response.content))
 
             # Filter events within the time range
             now = datetime.now(timezone.utc)
             end_date = now + timedelta(days=days_ahead)
 
             events = []
-            for component in cal.walk():
-                if component.name == "VEVENT":
-                    event = self._parse_ical_event(component)
-                    if event and now <= event.start_time <= end_date:
-                        events.append(event)
+            for component in cal.walk('VEVENT'):
+                # Window-check on DTSTART before building the full event
+                dtstart = self._peek_dtstart(component)
+                if dtstart is None or not (now <= dtstart <= end_date):
+                    continue
+                event = self._parse_ical_event(component, dtstart)
+                if event:
+                    events.append(event)
 
             # Sort by start time
             events.sort(key=lambda x: x.start_time)
@@ -120,9 +143,9 @@ class CalendarService:
                 "maxResults": 100
             }
 
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self._session.get(url, headers=headers, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Parse events
             events = []
@@ -137,25 +160,36 @@ class CalendarService:
             print(f"Error fetching Google Calendar events: {e}")
             return self._mock_calendar_events(days_ahead)
 
-    def _parse_ical_event(self, component) -> Optional[CalendarEvent]:
+    @staticmethod
+    def _to_aware_datetime(value) -> datetime:
+        """Normalize an iCal date/datetime value to a timezone-aware datetime"""
+        # Convert to datetime if date only
+        if not isinstance(value, datetime):
+            return datetime.combine(value, datetime.min.time()).replace(tzinfo=timezone.utc)
+        # Ensure timezone aware
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+
+    def _peek_dtstart(self, component) -> Optional[datetime]:
+        """Read just the start time of a VEVENT, or None if it has none"""
+        dtstart = component.get('DTSTART')
+        if dtstart is None:
+            return None
+        try:
+            return self._to_aware_datetime(dtstart.dt)
+        except Exception as e:
+            print(f"Error parsing iCal event: {e}")
+            return None
+
+    def _parse_ical_event(self, component, dtstart: Optional[datetime] = None) -> Optional[CalendarEvent]:
         """Parse an iCal VEVENT component into a CalendarEvent"""
         try:
             # Extract basic info
             summary = str(component.get('SUMMARY', 'Untitled Event'))
-            dtstart = component.get('DTSTART').dt
-            dtend = component.get('DTEND').dt if component.get('DTEND') else dtstart
-
-            # Convert to datetime if date only
-            if not isinstance(dtstart, datetime):
-                dtstart = datetime.combine(dtstart, datetime.min.time()).replace(tzinfo=timezone.utc)
-            if not isinstance(dtend, datetime):
-                dtend = datetime.combine(dtend, datetime.min.time()).replace(tzinfo=timezone.utc)
-
-            # Ensure timezone aware
-            if dtstart.tzinfo is None:
-                dtstart = dtstart.replace(tzinfo=timezone.utc)
-            if dtend.tzinfo is None:
-                dtend = dtend.replace(tzinfo=timezone.utc)
+            if dtstart is None:
+                dtstart = self._to_aware_datetime(component.get('DTSTART').dt)
+            dtend = self._to_aware_datetime(component.get('DTEND').dt) if component.get('DTEND') else dtstart
 
             # Extract attendees
             attendees = []
@@ -167,12 +201,12 @@ class CalendarService:
                 for attendee in attendee_list:
                     # Extract email from mailto: URI
                     attendee_str = str(attendee)
-                    email_match = re.search(r'mailto:([^\s]+)', attendee_str)
+                    email_match = _MAILTO_RE.search(attendee_str)
                     if email_match:
                         attendees.append(email_match.group(1))
 
             return CalendarEvent(
-                id=str(component.get('UID', str(uuid.uuid4()))),
+                id=str(component.get('UID') or uuid.uuid4()),
                 title=summary,
                 start_time=dtstart,
                 end_time=dtend,
@@ -200,9 +234,9 @@ class CalendarService:
             if not start_str or not end_str:
                 return None
 
-            # Parse to datetime
-            start_dt = datetime.fromisoformat(start_str.replace('Z', '+00:00'))
-            end_dt = datetime.fromisoformat(end_str.replace('Z', '+00:00'))
+            # Parse to datetime (Python 3.11+ fromisoformat accepts a trailing 'Z')
+            start_dt = datetime.fromisoformat(start_str)
+            end_dt = datetime.fromisoformat(end_str)
 
             # Extract attendees
             attendees = []
@@ -212,7 +246,7 @@ class CalendarService:
                     attendees.append(email)
 
             return CalendarEvent(
-                id=item.get('id', str(uuid.uuid4())),
+                id=item.get('id') or str(uuid.uuid4()),
                 title=item.get('summary', 'Untitled Event'),
                 start_time=start_dt,
                 end_time=end_dt,
@@ -4,20 +4,33 @@ NO EMAIL BODY CONTENT IS READ - only From/To/CC/timestamps
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional
 from collections import defaultdict
 
+import orjson
+
 from subtext.models import EmailInteraction
 
 # Optional import
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
     print("Warning: requests not available for Gmail API")
 
+# Concurrent per-message metadata fetches (each is a small, latency-bound GET)
+FETCH_CONCURRENCY = 16
+
+# Email in angle brackets, else a bare address bounded by header delimiters
+# (keeps every RFC 5322 local-part character such as o'brien; no backtracking blowup)
+_ANGLE_EMAIL_RE = re.compile(r'<([^>]+)>')
+_BARE_EMAIL_RE = re.compile(r'[^\s<>,;"()]+@[^\s<>,;"()]+')
+
 
 class GmailIngestionService:
     """
@@ -25,9 +38,35 @@ class GmailIngestionService:
     PRIVACY-FIRST: Only reads metadata (From/To/CC/timestamps), never body content
     """
 
+    # Mock email patterns
+    MOCK_PEOPLE = (
+        "alice@company.com",
+        "bob@company.com",
+        "manager@company.com",
+        "director@company.com",
+        "teammate1@company.com",
+        "teammate2@company.com"
+    )
+
     def __init__(self):
         """Initialize Gmail ingestion service"""
         self.base_url = "https://gmail.googleapis.com/gmail/v1/users/me"
+        self.session = self._create_session() if REQUESTS_AVAILABLE else None
+
+    @staticmethod
+    def _create_session():
+        """Keep-alive session with a pool large enough for the fetch threads"""
+        session = requests.Session()
+        # Concurrent gets can trip the per-user Gmail quota - back off on 429 instead of dropping messages
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=FETCH_CONCURRENCY, max_retries=retry)
+        session.mount("https://", adapter)
+        return session
 
     def fetch_email_metadata(
         self,
@@ -62,14 +101,13 @@ class GmailIngestionService:
             if not messages:
                 return []
 
-            # Fetch metadata for each message
-            interactions = []
-            for msg_id in messages[:max_results]:  # Limit to max_results
-                interaction = self._fetch_message_metadata(access_token, msg_id)
-                if interaction:
-                    interactions.append(interaction)
-
-            return interactions
+            # Fetch metadata for each message (concurrently, results keep message order)
+            with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY) as executor:
+                results = executor.map(
+                    lambda msg_id: self._fetch_message_metadata(access_token, msg_id),
+                    messages[:max_results]  # Limit to max_results
+                )
+                return [interaction for interaction in results if interaction]
 
         except Exception as e:
             print(f"Error fetching Gmail metadata: {e}")
@@ -86,14 +124,15 @@ class GmailIngestionService:
         headers = {"Authorization": f"Bearer {access_token}"}
         params = {
             "q": query,
-            "maxResults": max_results
+            "maxResults": max_results,
+            "fields": "messages/id"  # Only the ids are used
         }
 
         url = f"{self.base_url}/messages"
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = self.session.get(url, headers=headers, params=params, timeout=30)
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         messages = data.get("messages", [])
 
         return [msg["id"] for msg in messages]
@@ -109,14 +148,19 @@ class GmailIngestionService:
         """
 
         headers = {"Authorization": f"Bearer {access_token}"}
-        params = {"format": "metadata"}  # Only fetch metadata, not body
+        params = {
+            "format": "metadata",  # Only fetch metadata, not body
+            # ...and only the headers and fields we actually read
+            "metadataHeaders": ["From", "To", "Cc", "In-Reply-To"],
+            "fields": "threadId,internalDate,payload/headers"
+        }
 
         url = f"{self.base_url}/messages/{message_id}"
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.session.get(url, headers=headers, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Extract headers
             headers_dict = {}
@@ -158,10 +202,14 @@ class GmailIngestionService:
         if not email_str:
             return ""
 
-        # Match email in angle brackets or standalone
-        match = re.search(r'<([^>]+)>|([^\s]+@[^\s]+)', email_str)
+        # Match email in angle brackets, else standalone
+        match = _ANGLE_EMAIL_RE.search(email_str)
+        if match:
+            return match.group(1).strip().lower()
+
+        match = _BARE_EMAIL_RE.search(email_str)
         if match:
-            return (match.group(1) or match.group(2)).strip().lower()
+            return match.group(0).lower()
 
         return ""
 
@@ -170,16 +218,15 @@ class GmailIngestionService:
         if not emails_str:
             return []
 
-        # Split by comma and extract each email
-        parts = emails_str.split(',')
-        emails = []
-
-        for part in parts:
+        # Per recipient, so an address inside a display name never beats the <...> one;
+        # dict keeps first-seen order while deduping
+        emails: Dict[str, None] = {}
+        for part in emails_str.split(','):
             email = self._extract_email(part)
             if email:
-                emails.append(email)
+                emails[email] = None
 
-        return emails
+        return list(emails)
 
     def calculate_response_times(
         self,
@@ -198,19 +245,20 @@ class GmailIngestionService:
             if interaction.thread_id:
                 threads[interaction.thread_id].append(interaction)
 
+        # Sort each thread once and map every email to the one before it
+        prev_in_thread: Dict[int, EmailInteraction] = {}
+        for thread_emails in threads.values():
+            thread_emails.sort(key=lambda x: x.timestamp)
+            for previous, current in zip(thread_emails, thread_emails[1:]):
+                prev_in_thread[id(current)] = previous
+
         # Calculate response times
         updated_interactions = []
         for interaction in interactions:
             if interaction.is_reply and interaction.thread_id:
-                thread_emails = threads[interaction.thread_id]
-                # Sort by timestamp
-                thread_emails.sort(key=lambda x: x.timestamp)
-
-                # Find previous email in thread
-                idx = thread_emails.index(interaction)
-                if idx > 0:
-                    previous = thread_emails[idx - 1]
-                    time_diff = interaction.timestamp - previous.timestamp
+                prev = prev_in_thread.get(id(interaction))
+                if prev is not None:
+                    time_diff = interaction.timestamp - prev.timestamp
                     interaction.response_time_hours = time_diff.total_seconds() / 3600
 
             updated_interactions.append(interaction)
@@ -222,47 +270,41 @@ class GmailIngestionService:
         print("⚠️ Using mock email data - provide Gmail OAuth token for real data")
 
         now = datetime.now(timezone.utc)
-        interactions = []
-
-        # Mock email patterns
-        people = [
-            "alice@company.com",
-            "bob@company.com",
-            "manager@company.com",
-            "director@company.com",
-            "teammate1@company.com",
-            "teammate2@company.com"
-        ]
+        people = self.MOCK_PEOPLE
+        interactions: List[EmailInteraction] = []
 
         for day in range(days_back):
             date = now - timedelta(days=day)
-
-            # Morning check-in with manager
-            interactions.append(EmailInteraction(
-                from_email="user@company.com",
-                to_emails=["manager@company.com"],
-                cc_emails=[],
-                timestamp=date.replace(hour=9),
-                is_reply=False
-            ))
-
-            # Team discussions
-            interactions.append(EmailInteraction(
-                from_email=people[day % len(people)],
-                to_emails=["user@company.com", people[(day + 1) % len(people)]],
-                cc_emails=["manager@company.com"],
-                timestamp=date.replace(hour=11),
-                is_reply=False
-            ))
-
-            # Reply to someone
-            interactions.append(EmailInteraction(
-                from_email="user@company.com",
-                to_emails=[people[day % len(people)]],
-                cc_emails=[],
-                timestamp=date.replace(hour=14),
-                is_reply=True,
-                response_time_hours=2.5
+            person = people[day % len(people)]
+            next_person = people[(day + 1) % len(people)]
+
+            # Server-built constants - skip validation with model_construct
+            interactions.extend((
+                # Morning check-in with manager
+                EmailInteraction.model_construct(
+                    from_email="user@company.com",
+                    to_emails=["manager@company.com"],
+                    cc_emails=[],
+                    timestamp=date.replace(hour=9),
+                    is_reply=False
+                ),
+                # Team discussions
+                EmailInteraction.model_construct(
+                    from_email=person,
+                    to_emails=["user@company.com", next_person],
+                    cc_emails=["manager@company.com"],
+                    timestamp=date.replace(hour=11),
+                    is_reply=False
+                ),
+                # Reply to someone
+                EmailInteraction.model_construct(
+                    from_email="user@company.com",
+                    to_emails=[person],
+                    cc_emails=[],
+                    timestamp=date.replace(hour=14),
+                    is_reply=True,
+                    response_time_hours=2.5
+                ),
             ))
 
         return interactions
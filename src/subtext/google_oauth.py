@@ -3,11 +3,18 @@ Google OAuth Service - Handle OAuth 2.0 flow for Gmail and Calendar access
 """
 
 import os
+import sqlite3
+import threading
 import uuid
 from typing import Optional, Dict
 from datetime import datetime, timedelta, timezone
 from urllib.parse import urlencode
 
+import orjson
+
+from subtext.security import encrypt_text, decrypt_text, encryption_service
+from subtext.settings import OAUTH_TOKEN_DB
+
 # Optional imports
 try:
     import requests
@@ -43,8 +50,81 @@ class GoogleOAuthService:
             "https://www.googleapis.com/auth/userinfo.email",  # User's email address
         ]
 
-        # In-memory token storage (replace with database in production)
+        # Token storage: sqlite in DATA_DIR, tokens encrypted at rest (opened on first use)
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+
+        # Only persist tokens encrypted under a stable key (ENCRYPTION_MASTER_KEY) - never in
+        # plaintext, and not under a temporary key the next restart could not decrypt
+        self.persist_tokens = encryption_service.aesgcm is not None and encryption_service.persistent_key
         self.token_store: Dict[str, Dict] = {}
+        if not self.persist_tokens:
+            print("⚠️ Encryption or ENCRYPTION_MASTER_KEY not available - OAuth tokens kept in memory only (lost on restart)")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the token database on first use (call with _db_lock held)"""
+        if self._db is None:
+            db = sqlite3.connect(OAUTH_TOKEN_DB, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                """CREATE TABLE IF NOT EXISTS oauth_tokens (
+                    user_id TEXT PRIMARY KEY,
+                    access_token TEXT NOT NULL,
+                    refresh_token TEXT,
+                    expires_at TEXT,
+                    token_type TEXT,
+                    scope TEXT
+                )"""
+            )
+            db.commit()
+            self._db = db
+        return self._db
+
+    @staticmethod
+    def _decrypt_token(value: Optional[str]) -> Optional[str]:
+        """Decrypt a stored token; None if it was written under a different master key"""
+        token = decrypt_text(value)
+        if token and token.startswith("[ENCRYPTED"):
+            return None
+        return token
+
+    def _delete_tokens(self, user_id: str) -> None:
+        """Remove a user's row from the token database"""
+        with self._db_lock:
+            db = self._connection()
+            db.execute("DELETE FROM oauth_tokens WHERE user_id = ?", (user_id,))
+            db.commit()
+
+    def _load_tokens(self, user_id: str) -> Optional[Dict]:
+        """Read and decrypt a user's stored tokens"""
+        if not self.persist_tokens:
+            tokens = self.token_store.get(user_id)
+            return dict(tokens) if tokens else None
+
+        with self._db_lock:
+            row = self._connection().execute(
+                "SELECT access_token, refresh_token, expires_at, token_type, scope "
+                "FROM oauth_tokens WHERE user_id = ?",
+                (user_id,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        access_token = self._decrypt_token(row[0])
+        if not access_token:
+            # Written under a different master key - drop the unreadable row
+            self._delete_tokens(user_id)
+            return None
+
+        return {
+            "access_token": access_token,
+            "refresh_token": self._decrypt_token(row[1]),
+            "expires_at": row[2],
+            "token_type": row[3],
+            "scope": row[4]
+        }
 
     def get_authorization_url(self, state: Optional[str] = None) -> str:
         """
@@ -104,7 +184,7 @@ class GoogleOAuthService:
         response = requests.post(self.token_uri, data=data, timeout=30)
         response.raise_for_status()
 
-        tokens = response.json()
+        tokens = orjson.loads(response.content)
 
         # Calculate expiration time
         expires_in = tokens.get("expires_in", 3600)
@@ -137,7 +217,7 @@ class GoogleOAuthService:
         response = requests.post(self.token_uri, data=data, timeout=30)
         response.raise_for_status()
 
-        tokens = response.json()
+        tokens = orjson.loads(response.content)
 
         # Calculate expiration
         expires_in = tokens.get("expires_in", 3600)
@@ -168,26 +248,40 @@ class GoogleOAuthService:
         )
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         return data.get("email", "")
 
     def store_tokens(self, user_id: str, tokens: Dict) -> None:
         """
-        Store tokens for a user (in-memory for now)
-
-        In production, store in database with encryption
+        Store tokens for a user (encrypted, persisted in sqlite)
+        Falls back to in-memory storage when encryption is unavailable
 
         Args:
             user_id: Unique user identifier
             tokens: Token dict from OAuth
         """
-        self.token_store[user_id] = {
-            "access_token": tokens["access_token"],
-            "refresh_token": tokens.get("refresh_token"),
-            "expires_at": tokens.get("expires_at"),
-            "token_type": tokens.get("token_type", "Bearer"),
-            "scope": tokens.get("scope", " ".join(self.scopes))
-        }
+        if not self.persist_tokens:
+            self.token_store[user_id] = {
+                "access_token": tokens["access_token"],
+                "refresh_token": tokens.get("refresh_token"),
+                "expires_at": tokens.get("expires_at"),
+                "token_type": tokens.get("token_type", "Bearer"),
+                "scope": tokens.get("scope", " ".join(self.scopes))
+            }
+            return
+
+        row = (
+            user_id,
+            encrypt_text(tokens["access_token"]),
+            encrypt_text(tokens.get("refresh_token")),
+            tokens.get("expires_at"),
+            tokens.get("token_type", "Bearer"),
+            tokens.get("scope", " ".join(self.scopes))
+        )
+        with self._db_lock:
+            db = self._connection()
+            db.execute("INSERT OR REPLACE INTO oauth_tokens VALUES (?, ?, ?, ?, ?, ?)", row)
+            db.commit()
 
     def get_valid_access_token(self, user_id: str) -> Optional[str]:
         """
@@ -200,11 +294,10 @@ class GoogleOAuthService:
             Valid access token or None if not found
         """
 
-        if user_id not in self.token_store:
+        tokens = self._load_tokens(user_id)
+        if tokens is None:
             return None
 
-        tokens = self.token_store[user_id]
-
         # Check if token is expired
         expires_at_str = tokens.get("expires_at")
         if expires_at_str:
@@ -220,7 +313,7 @@ class GoogleOAuthService:
                         # Update stored tokens
                         tokens["access_token"] = new_tokens["access_token"]
                         tokens["expires_at"] = new_tokens.get("expires_at")
-                        self.token_store[user_id] = tokens
+                        self.store_tokens(user_id, tokens)
                     except Exception as e:
                         print(f"Error refreshing token: {e}")
                         return None
@@ -238,10 +331,10 @@ class GoogleOAuthService:
             True if revoked successfully
         """
 
-        if user_id not in self.token_store:
+        tokens = self._load_tokens(user_id)
+        if tokens is None:
             return False
 
-        tokens = self.token_store[user_id]
         access_token = tokens.get("access_token")
 
         if access_token and REQUESTS_AVAILABLE:
@@ -255,7 +348,11 @@ class GoogleOAuthService:
                 print(f"Error revoking token with Google: {e}")
 
         # Remove from local storage
-        del self.token_store[user_id]
+        if not self.persist_tokens:
+            self.token_store.pop(user_id, None)
+            return True
+
+        self._delete_tokens(user_id)
         return True
 
 
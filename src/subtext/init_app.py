@@ -7,6 +7,7 @@ from datetime import datetime
 
 from fastapi import FastAPI  # type: ignore
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from subtext.settings import IS_TEST
 from subtext.version import VERSION
@@ -51,6 +52,7 @@ app = FastAPI(
         "name": "Private program, do not distribute",
     },
     description=app_description(),
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -4,125 +4,312 @@ Provides scenario analysis and tone checking using Claude or OpenAI
 """
 
 import os
-import json
+import importlib.util
+import re
+import hashlib
+import unicodedata
+import threading
+import time
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 import uuid
 from datetime import datetime, timezone
 
+import orjson
+
 from subtext.models import (
     StrategyOption, StrategyType, RiskLevel,
     ScenarioAnalysis, ToneAnalysis
 )
 
-# Optional import - gracefully handle if not installed
-try:
-    from anthropic import Anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
+# Optional dependency - only imported when the client is first built
+ANTHROPIC_AVAILABLE = importlib.util.find_spec("anthropic") is not None
+if not ANTHROPIC_AVAILABLE:
     print("Warning: anthropic package not installed. Using mock responses.")
 
+DEFAULT_MODEL = "claude-3-5-sonnet-20241022"
 
-class PoliticoLLMService:
-    """
-    LLM service for political scenario analysis and communication guidance
-    Tone: Corporate Zen - calm, strategic, objective, supportive
-    """
+# Max number of completions kept in the in-process response cache
+RESPONSE_CACHE_SIZE = 256
 
-    def __init__(self):
-        """Initialize with API key from environment"""
-        self.anthropic_key = os.environ.get("ANTHROPIC_API_KEY")
-        self.client = None
-
-        if ANTHROPIC_AVAILABLE and self.anthropic_key:
-            try:
-                self.client = Anthropic(api_key=self.anthropic_key)
-                print("✅ Anthropic LLM service initialized")
-            except Exception as e:
-                print(f"⚠️ Failed to initialize Anthropic: {e}")
-        else:
-            if not ANTHROPIC_AVAILABLE:
-                print("⚠️ Anthropic package not available - using mock responses")
-            else:
-                print("⚠️ ANTHROPIC_API_KEY not set - using mock responses")
+# SDK-level retries (exponential backoff, honors Retry-After on 429/529)
+MAX_RETRIES = 3
 
-    def analyze_scenario(
-        self,
-        scenario_description: str,
-        stakeholders_involved: List[str],
-        user_goal: str
-    ) -> ScenarioAnalysis:
-        """
-        Analyze a political scenario and provide strategic options
-        Returns 3 approaches: Passive, Assertive, Strategic
-        """
+# Circuit breaker: after this many consecutive failed calls, skip Claude for a while
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN_SECONDS = 30.0
 
-        if not self.client:
-            return self._mock_scenario_analysis(scenario_description, user_goal)
+# Keep-alive pool for api.anthropic.com, sized for the 12-thread asyncwrap executor
+HTTP_MAX_CONNECTIONS = 20
+HTTP_MAX_KEEPALIVE = 12
+HTTP_KEEPALIVE_EXPIRY = 60.0
 
-        prompt = f"""You are an expert in organizational psychology and workplace dynamics.
-Analyze this office politics scenario with a "Corporate Zen" approach - calm, strategic, objective, and supportive.
+# Claude often wraps its JSON answer in a ```json fenced block
+_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
 
-**Scenario:**
-{scenario_description}
+_HSPACE_RE = re.compile(r"[ \t\f\v\u00a0]+")
+_TRAILING_SPACE_RE = re.compile(r" *\n *")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
 
-**Stakeholders Involved:**
-{', '.join(stakeholders_involved) if stakeholders_involved else 'Not specified'}
 
-**User's Goal:**
-{user_goal}
+def _canonicalize(text: str) -> str:
+    """
+    Normalize cosmetic differences so near-identical prompts share a cache key
+    Case is preserved - it matters for tone analysis
+    """
+    text = unicodedata.normalize("NFC", text).replace("\r\n", "\n").strip()
+    text = _HSPACE_RE.sub(" ", text)
+    text = _TRAILING_SPACE_RE.sub("\n", text)
+    return _BLANK_LINES_RE.sub("\n\n", text)
+
+
+# Static instructions go in the system prompt so every request shares the same prefix
+SCENARIO_SYSTEM_PROMPT = """You are an expert in organizational psychology and workplace dynamics.
+Analyze office politics scenarios with a "Corporate Zen" approach - calm, strategic, objective, and supportive.
 
 **Provide a JSON response with this exact structure:**
-{{
+{
   "power_dynamic": "Who holds the power in this scenario and why",
   "risk_level": "low|medium|high|critical",
   "political_implications": "How this situation could affect the user's career/reputation",
   "strategy_options": [
-    {{
+    {
       "strategy_type": "passive",
       "title": "Low-Confrontation Approach",
       "description": "A diplomatic, low-risk option",
       "pros": ["Benefit 1", "Benefit 2"],
       "cons": ["Drawback 1", "Drawback 2"],
       "recommended_actions": ["Step 1", "Step 2"]
-    }},
-    {{
+    },
+    {
       "strategy_type": "assertive",
       "title": "Professional Boundary-Setting",
       "description": "Clear, professional communication",
       "pros": ["Benefit 1", "Benefit 2"],
       "cons": ["Drawback 1", "Drawback 2"],
       "recommended_actions": ["Step 1", "Step 2"]
-    }},
-    {{
+    },
+    {
       "strategy_type": "strategic",
       "title": "Long-Term Alliance Building",
       "description": "Strategic positioning and relationship building",
       "pros": ["Benefit 1", "Benefit 2"],
       "cons": ["Drawback 1", "Drawback 2"],
       "recommended_actions": ["Step 1", "Step 2"]
-    }}
+    }
   ]
-}}
+}
 
 Focus on ethical, professional approaches. Do not encourage toxic behavior."""
 
+TONE_SYSTEM_PROMPT = """You are an expert in workplace communication and Non-Violent Communication (NVC) techniques.
+
+**Provide a JSON response with this exact structure:**
+{
+  "aggression_score": 0-100 (how aggressive/confrontational the tone is),
+  "passivity_score": 0-100 (how passive/weak the tone is),
+  "political_implications": "One sentence about how this might be perceived",
+  "suggested_rewrite": "A rewritten version using NVC principles that maintains the core message"
+}
+
+The rewrite should be professional, clear, and assertive without being aggressive."""
+
+
+class PoliticoLLMService:
+    """
+    LLM service for political scenario analysis and communication guidance
+    Tone: Corporate Zen - calm, strategic, objective, supportive
+    """
+
+    def __init__(self):
+        """Read config from environment - the Anthropic client is built on first use"""
+        self.anthropic_key = os.environ.get("ANTHROPIC_API_KEY")
+        self._client = None
+        self._client_initialized = False
+        self._client_lock = threading.Lock()
+        self._response_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._breaker_open_until = 0.0
+
+        if not ANTHROPIC_AVAILABLE:
+            print("⚠️ Anthropic package not available - using mock responses")
+        elif not self.anthropic_key:
+            print("⚠️ ANTHROPIC_API_KEY not set - using mock responses")
+
+    @property
+    def client(self):
+        """Anthropic client, created lazily so importing this module stays cheap"""
+        if not self._client_initialized:
+            with self._client_lock:
+                if not self._client_initialized:
+                    self._client = self._create_client()
+                    self._client_initialized = True
+        return self._client
+
+    def _create_client(self):
+        """Build the Anthropic client, or None when it is not configured"""
+        if not (ANTHROPIC_AVAILABLE and self.anthropic_key):
+            return None
+        try:
+            import httpx
+            from anthropic import Anthropic
+
+            # Pool limits belong on the transport - httpx ignores Client(limits=) when transport= is given
+            http_client = httpx.Client(
+                timeout=httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=5.0),
+                transport=httpx.HTTPTransport(
+                    retries=1,
+                    limits=httpx.Limits(
+                        max_connections=HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+                    ),
+                ),
+            )
+            client = Anthropic(
+                api_key=self.anthropic_key,
+                max_retries=MAX_RETRIES,
+                http_client=http_client,
+            )
+            print("✅ Anthropic LLM service initialized")
+            return client
+        except Exception as e:
+            print(f"⚠️ Failed to initialize Anthropic: {e}")
+            return None
+
+    @property
+    def available(self) -> bool:
+        """True when Claude is configured and the circuit breaker is closed"""
+        return self.client is not None and time.monotonic() >= self._breaker_open_until
+
+    @staticmethod
+    def _is_transient(error: Exception) -> bool:
+        """Outage-type errors (network, timeout, 429, 5xx) - only these count toward the breaker"""
+        import anthropic
+
+        if isinstance(error, (anthropic.APIConnectionError, anthropic.RateLimitError)):
+            return True  # APITimeoutError is an APIConnectionError
+        return isinstance(error, anthropic.APIStatusError) and error.status_code >= 500
+
+    def _unavailable_message(self) -> str:
+        """Why a mock response is being returned instead of a Claude analysis"""
+        if self.client is None:
+            return "LLM not configured. Set ANTHROPIC_API_KEY environment variable."
+        if time.monotonic() < self._breaker_open_until:
+            return "Claude is temporarily unavailable. Please try again in a minute."
+        return "Claude could not complete this analysis. Please try again."
+
+    def _record_result(self, ok: bool) -> None:
+        """Update the circuit breaker after a Claude call"""
+        with self._cache_lock:
+            if ok:
+                self._consecutive_failures = 0
+                return
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= BREAKER_FAILURE_THRESHOLD:
+                self._breaker_open_until = time.monotonic() + BREAKER_COOLDOWN_SECONDS
+                self._consecutive_failures = 0
+                print(f"⚠️ Claude failing repeatedly - pausing calls for {BREAKER_COOLDOWN_SECONDS:.0f}s")
+
+    def complete(
+        self,
+        prompt: str,
+        max_tokens: int,
+        model: str = DEFAULT_MODEL,
+        system: Optional[str] = None
+    ) -> str:
+        """
+        Send a single-turn prompt to Claude and return the response text
+        Identical prompts are answered from an in-process LRU cache
+        """
+        key = self._cache_key(prompt, max_tokens, model, system)
+        with self._cache_lock:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                self._response_cache.move_to_end(key)
+                return cached
+
+        if time.monotonic() < self._breaker_open_until:
+            raise RuntimeError("Claude temporarily unavailable (circuit open)")
+
+        kwargs: Dict[str, Any] = {}
+        if system:
+            kwargs["system"] = system
         try:
             message = self.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=2000,
-                messages=[{"role": "user", "content": prompt}]
+                model=model,
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": prompt}],
+                **kwargs
             )
+        except Exception as e:
+            # Bad requests (400/401/403/404) are not an outage - leave the breaker alone
+            if self._is_transient(e):
+                self._record_result(False)
+            raise
+        self._record_result(True)
+        text = message.content[0].text
+
+        with self._cache_lock:
+            self._response_cache[key] = text
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return text
+
+    def evict(
+        self,
+        prompt: str,
+        max_tokens: int,
+        model: str = DEFAULT_MODEL,
+        system: Optional[str] = None
+    ) -> None:
+        """Drop a cached completion, e.g. when its text could not be parsed"""
+        with self._cache_lock:
+            self._response_cache.pop(self._cache_key(prompt, max_tokens, model, system), None)
+
+    @staticmethod
+    def _parse_json_response(response_text: str) -> Dict[str, Any]:
+        """Parse Claude's JSON answer (it might be inside a markdown code block)"""
+        match = _JSON_FENCE_RE.search(response_text)
+        return orjson.loads(match.group(1) if match else response_text)
+
+    @staticmethod
+    def _cache_key(prompt: str, max_tokens: int, model: str, system: Optional[str] = None) -> str:
+        """Cache key for a completion request"""
+        raw = f"{model}\0{max_tokens}\0{system or ''}\0{_canonicalize(prompt)}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
 
-            # Parse the response
-            response_text = message.content[0].text
-            # Extract JSON from response (it might have markdown code blocks)
-            if "```json" in response_text:
-                json_str = response_text.split("```json")[1].split("```")[0].strip()
-            else:
-                json_str = response_text
+    def analyze_scenario(
+        self,
+        scenario_description: str,
+        stakeholders_involved: List[str],
+        user_goal: str
+    ) -> ScenarioAnalysis:
+        """
+        Analyze a political scenario and provide strategic options
+        Returns 3 approaches: Passive, Assertive, Strategic
+        """
+
+        if not self.available:
+            return self._mock_scenario_analysis(scenario_description, user_goal)
 
-            data = json.loads(json_str)
+        prompt = f"""Analyze this office politics scenario.
+
+**Scenario:**
+{scenario_description}
+
+**Stakeholders Involved:**
+{', '.join(stakeholders_involved) if stakeholders_involved else 'Not specified'}
+
+**User's Goal:**
+{user_goal}"""
+
+        try:
+            response_text = self.complete(prompt, max_tokens=2000, system=SCENARIO_SYSTEM_PROMPT)
+
+            # Parse the response
+            data = self._parse_json_response(response_text)
 
             # Convert to our model
             return ScenarioAnalysis(
@@ -146,6 +333,7 @@ Focus on ethical, professional approaches. Do not encourage toxic behavior."""
 
         except Exception as e:
             print(f"Error calling LLM: {e}")
+            self.evict(prompt, max_tokens=2000, system=SCENARIO_SYSTEM_PROMPT)
             return self._mock_scenario_analysis(scenario_description, user_goal)
 
     def analyze_tone(self, email_draft: str) -> ToneAnalysis:
@@ -154,40 +342,17 @@ Focus on ethical, professional approaches. Do not encourage toxic behavior."""
         Returns aggression/passivity scores and a suggested rewrite
         """
 
-        if not self.client:
+        if not self.available:
             return self._mock_tone_analysis(email_draft)
 
-        prompt = f"""You are an expert in workplace communication and Non-Violent Communication (NVC) techniques.
-
-Analyze this email draft for tone and political implications:
+        prompt = f"""Analyze this email draft for tone and political implications:
 
 **Email Draft:**
-{email_draft}
-
-**Provide a JSON response with this exact structure:**
-{{
-  "aggression_score": 0-100 (how aggressive/confrontational the tone is),
-  "passivity_score": 0-100 (how passive/weak the tone is),
-  "political_implications": "One sentence about how this might be perceived",
-  "suggested_rewrite": "A rewritten version using NVC principles that maintains the core message"
-}}
-
-The rewrite should be professional, clear, and assertive without being aggressive."""
+{email_draft}"""
 
         try:
-            message = self.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=1500,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            response_text = message.content[0].text
-            if "```json" in response_text:
-                json_str = response_text.split("```json")[1].split("```")[0].strip()
-            else:
-                json_str = response_text
-
-            data = json.loads(json_str)
+            response_text = self.complete(prompt, max_tokens=1500, system=TONE_SYSTEM_PROMPT)
+            data = self._parse_json_response(response_text)
 
             return ToneAnalysis(
                 id=str(uuid.uuid4()),
@@ -200,18 +365,20 @@ The rewrite should be professional, clear, and assertive without being aggressiv
 
         except Exception as e:
             print(f"Error analyzing tone: {e}")
+            self.evict(prompt, max_tokens=1500, system=TONE_SYSTEM_PROMPT)
             return self._mock_tone_analysis(email_draft)
 
     def _mock_scenario_analysis(self, scenario: str, goal: str) -> ScenarioAnalysis:
         """Mock response when LLM is not available"""
-        return ScenarioAnalysis(
+        # Server-built constants - skip validation with model_construct
+        return ScenarioAnalysis.model_construct(
             id=str(uuid.uuid4()),
             scenario_description=scenario,
-            power_dynamic="⚠️ LLM not configured. Set ANTHROPIC_API_KEY environment variable.",
+            power_dynamic=f"⚠️ {self._unavailable_message()}",
             risk_level=RiskLevel.MEDIUM,
             political_implications="Unable to analyze without LLM API access.",
             strategy_options=[
-                StrategyOption(
+                StrategyOption.model_construct(
                     strategy_type=StrategyType.PASSIVE,
                     title="Document and Wait",
                     description="Document the situation and monitor",
@@ -219,7 +386,7 @@ The rewrite should be professional, clear, and assertive without being aggressiv
                     cons=["Slow", "May miss opportunities"],
                     recommended_actions=["Document everything", "Observe patterns"]
                 ),
-                StrategyOption(
+                StrategyOption.model_construct(
                     strategy_type=StrategyType.ASSERTIVE,
                     title="Direct Communication",
                     description="Address the issue directly but professionally",
@@ -227,7 +394,7 @@ The rewrite should be professional, clear, and assertive without being aggressiv
                     cons=["Potential confrontation", "Requires courage"],
                     recommended_actions=["Schedule private meeting", "Use 'I' statements"]
                 ),
-                StrategyOption(
+                StrategyOption.model_construct(
                     strategy_type=StrategyType.STRATEGIC,
                     title="Build Support Network",
                     description="Strengthen alliances before acting",
@@ -240,12 +407,12 @@ The rewrite should be professional, clear, and assertive without being aggressiv
 
     def _mock_tone_analysis(self, email: str) -> ToneAnalysis:
         """Mock tone analysis when LLM is not available"""
-        return ToneAnalysis(
+        return ToneAnalysis.model_construct(
             id=str(uuid.uuid4()),
             original_text=email,
             aggression_score=50,
             passivity_score=50,
-            political_implications="⚠️ LLM not configured. Set ANTHROPIC_API_KEY for real analysis.",
+            political_implications=f"⚠️ {self._unavailable_message()}",
             suggested_rewrite=email
         )
 
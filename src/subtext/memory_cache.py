@@ -1,30 +1,19 @@
-import atexit
+import importlib.util
 import os
 import pathlib
 from typing import Optional
 
 from pydantic import BaseModel
 
-# Optional imports - gracefully handle if not installed
-try:
-    from filelock import FileLock
-    FILELOCK_AVAILABLE = True
-except ImportError:
-    FILELOCK_AVAILABLE = False
-    print("Warning: filelock package not installed. Shared memory locking disabled.")
-
-try:
-    from shared_memory_dict import SharedMemoryDict  # type: ignore
-    SHARED_MEMORY_AVAILABLE = True
-except ImportError:
-    SHARED_MEMORY_AVAILABLE = False
-    print("Warning: shared-memory-dict package not installed. Shared memory disabled.")
+# Optional packages - only imported when shared memory is actually created
+FILELOCK_AVAILABLE = importlib.util.find_spec("filelock") is not None
+SHARED_MEMORY_AVAILABLE = importlib.util.find_spec("shared_memory_dict") is not None
 
 HERE = pathlib.Path(__file__).parent
 LOCKPATH = HERE / "memory_cache.lock"
 
-# Only create lock if filelock is available
-LOCK = FileLock(str(LOCKPATH), timeout=1) if FILELOCK_AVAILABLE else None
+# Created on the first create_shared_memory() call if filelock is available
+LOCK = None
 
 # flake8: noqa: E402
 os.environ["SHARED_MEMORY_USE_LOCK"] = "1"
@@ -37,43 +26,62 @@ class SharedMemoryData(BaseModel):
     initialized: bool = False
 
 
-def _delete_shared_memory(smd):
-    """Delete shared memory when owner exits"""
+def _delete_shared_memory(smd) -> None:
+    """Close and unlink the shared memory block (owner only)"""
     if hasattr(smd, 'shm'):
         smd.shm.close()
         smd.shm.unlink()
-    del smd
 
 
-def _release(smd) -> None:
-    """Release shared memory when non-owner exits"""
+def release_shared_memory(smd) -> None:
+    """Close a worker's handle on the shared memory block"""
     if hasattr(smd, 'shm'):
         smd.shm.close()
-    del smd
 
 
-def create_shared_memory(owner: bool):
-    """Create shared memory dict if available, otherwise return a regular dict"""
+def _get_lock():
+    """Create the inter-process lock on first use"""
+    global LOCK
+    if LOCK is None and FILELOCK_AVAILABLE:
+        from filelock import FileLock
+        LOCK = FileLock(str(LOCKPATH), timeout=1)
+    return LOCK
+
+
+def create_shared_memory():
+    """
+    Create or attach to the shared memory dict if available, otherwise return a regular dict
+    Workers must call release_shared_memory() when done; the owner uses SharedMemoryOwner
+    """
     if not SHARED_MEMORY_AVAILABLE:
-        print("⚠️ Shared memory not available - using regular dict")
+        print("⚠️ Shared memory not available - install shared-memory-dict; using regular dict")
         return {}
 
-    if LOCK:
-        # Use the lock decorator if available
-        @LOCK
-        def _create():
-            smd = SharedMemoryDict(name=SHARED_MEMORY_NAME, size=SHARED_MEMORY_SIZE)
-            if owner:
-                atexit.register(_delete_shared_memory, smd)
-            else:
-                atexit.register(_release, smd)
-            return smd
-        return _create()
-    else:
-        # No lock available, create without locking
-        smd = SharedMemoryDict(name=SHARED_MEMORY_NAME, size=SHARED_MEMORY_SIZE)
-        if owner:
-            atexit.register(_delete_shared_memory, smd)
-        else:
-            atexit.register(_release, smd)
-        return smd
+    from shared_memory_dict import SharedMemoryDict  # type: ignore
+
+    lock = _get_lock()
+    if lock:
+        with lock:
+            return SharedMemoryDict(name=SHARED_MEMORY_NAME, size=SHARED_MEMORY_SIZE)
+
+    # No lock available, create without locking
+    print("⚠️ filelock not installed - creating shared memory without locking")
+    return SharedMemoryDict(name=SHARED_MEMORY_NAME, size=SHARED_MEMORY_SIZE)
+
+
+class SharedMemoryOwner:
+    """
+    Owns the shared memory block for the lifetime of the main process
+    Unlinks it on exit, so it must be entered exactly once, by the owning process
+    """
+
+    def __init__(self):
+        self.smd = None
+
+    def __enter__(self):
+        self.smd = create_shared_memory()
+        return self.smd
+
+    def __exit__(self, *exc_info) -> None:
+        _delete_shared_memory(self.smd)
+        self.smd = None
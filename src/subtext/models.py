@@ -3,15 +3,32 @@ Database models for Politico - Office Politics Navigator
 Designed with security, privacy, and strategic analysis in mind
 """
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Optional, List
+from typing import Iterator, Optional, List
 from enum import Enum
 from pydantic import BaseModel, Field
 
 
+# Set by batch_time() so every model built in one batch shares a single timestamp
+_NOW: ContextVar[Optional[datetime]] = ContextVar("_NOW", default=None)
+
+
 def utc_now():
-    """Get current UTC time"""
-    return datetime.now(timezone.utc)
+    """Get current UTC time (the batch timestamp inside batch_time())"""
+    return _NOW.get() or datetime.now(timezone.utc)
+
+
+@contextmanager
+def batch_time() -> Iterator[datetime]:
+    """Pin utc_now() to one timestamp while building many models at once"""
+    now = datetime.now(timezone.utc)
+    token = _NOW.set(now)
+    try:
+        yield now
+    finally:
+        _NOW.reset(token)
 
 
 # Enums for structured data
@@ -334,8 +334,8 @@ class NetworkAnalyzer:
     ) -> Tuple[str, str]:
         """Generate strategic advice for bridging a structural hole"""
 
-        # Default advice if no LLM
-        if not llm_service.client:
+        # Default advice if no LLM (unconfigured or circuit open)
+        if not llm_service.available:
             return (
                 f"High-centrality connection (score: {node.centrality_score:.2f}) - could expand your influence",
                 f"Route communication through {mutual_connections[0]} who can introduce you"
@@ -355,13 +355,7 @@ Provide 2 concise responses:
 Keep it professional and actionable."""
 
         try:
-            message = llm_service.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=150,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            response = message.content[0].text.strip()
+            response = llm_service.complete(prompt, max_tokens=150).strip()
             lines = [line.strip() for line in response.split('\n') if line.strip()]
 
             if len(lines) >= 2:
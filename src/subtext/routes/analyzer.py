@@ -10,11 +10,16 @@ from subtext.models import (
     AnalyzeToneRequest,
     ToneAnalysis,
 )
+from subtext.asyncwrap import asyncwrap
 from subtext.llm_service import llm_service
 from subtext.security import sanitize_input
 
 router = APIRouter(tags=["analyzer"])
 
+# Claude calls block for seconds - run them in the executor, not on the event loop
+_analyze_scenario = asyncwrap(llm_service.analyze_scenario)
+_analyze_tone = asyncwrap(llm_service.analyze_tone)
+
 
 @router.post("/analyze-scenario", response_model=ScenarioAnalysis)
 async def analyze_scenario(request: AnalyzeScenarioRequest) -> ScenarioAnalysis:
@@ -28,7 +33,7 @@ async def analyze_scenario(request: AnalyzeScenarioRequest) -> ScenarioAnalysis:
     goal_clean = sanitize_input(request.user_goal)
 
     # Call LLM service
-    analysis = llm_service.analyze_scenario(
+    analysis = await _analyze_scenario(
         scenario_description=scenario_clean,
         stakeholders_involved=request.stakeholders_involved,
         user_goal=goal_clean
@@ -48,7 +53,7 @@ async def analyze_tone(request: AnalyzeToneRequest) -> ToneAnalysis:
     email_clean = sanitize_input(request.email_draft)
 
     # Call LLM service
-    analysis = llm_service.analyze_tone(email_draft=email_clean)
+    analysis = await _analyze_tone(email_draft=email_clean)
 
     return analysis
 
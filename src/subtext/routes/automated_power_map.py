@@ -10,9 +10,13 @@ from subtext.gmail_ingestion import gmail_service
 from subtext.calendar_service import calendar_service
 from subtext.network_analyzer import network_analyzer
 from subtext.google_oauth import google_oauth_service
+from subtext.asyncwrap import asyncwrap
 
 router = APIRouter(tags=["automated-power-map"])
 
+# Insight generation calls Claude - run it in the executor, not on the event loop
+_build_power_map = asyncwrap(network_analyzer.build_power_map)
+
 
 @router.post("/automated-power-map/ingest", response_model=AutomatedPowerMap)
 async def ingest_workspace_data(request: IngestGoogleWorkspaceRequest) -> AutomatedPowerMap:
@@ -61,7 +65,7 @@ async def ingest_workspace_data(request: IngestGoogleWorkspaceRequest) -> Automa
 
         # Step 3: Build network graph and analyze
         print("Building network graph...")
-        power_map = network_analyzer.build_power_map(
+        power_map = await _build_power_map(
             email_interactions=email_interactions,
             calendar_events=calendar_events,
             user_email=request.user_email,
@@ -163,7 +167,7 @@ async def generate_from_oauth(
         print(f"Fetched {len(calendar_events)} calendar events")
 
         # Build power map
-        power_map = network_analyzer.build_power_map(
+        power_map = await _build_power_map(
             email_interactions=email_interactions,
             calendar_events=calendar_events,
             user_email=user_email,
@@ -197,7 +201,7 @@ async def generate_demo_power_map() -> AutomatedPowerMap:
     email_interactions = gmail_service._mock_email_interactions(days_back=30)
     calendar_events = calendar_service._mock_calendar_events(days_ahead=30)
 
-    power_map = network_analyzer.build_power_map(
+    power_map = await _build_power_map(
         email_interactions=email_interactions,
         calendar_events=calendar_events,
         user_email="user@company.com",
@@ -10,12 +10,16 @@ from subtext.models import (
     CalendarAnalysis, AnalyzeCalendarRequest,
     ConnectCalendarRequest, Stakeholder
 )
+from subtext.asyncwrap import asyncwrap
 from subtext.calendar_service import calendar_service
 from subtext.calendar_analyzer import calendar_analyzer
 from subtext.security import sanitize_input
 
 router = APIRouter(tags=["calendar"])
 
+# Per-meeting Claude calls block - keep them off the event loop
+_analyze_calendar = asyncwrap(calendar_analyzer.analyze_calendar)
+
 # In-memory storage for demo (replace with database in production)
 connected_calendars = {}
 stakeholders_db: List[Stakeholder] = []
@@ -46,7 +50,7 @@ async def analyze_calendar(request: AnalyzeCalendarRequest) -> CalendarAnalysis:
         manager_name = sanitize_input(request.user_manager_name)
 
     # Analyze calendar with stakeholder cross-reference
-    analysis = calendar_analyzer.analyze_calendar(
+    analysis = await _analyze_calendar(
         events=events,
         stakeholders=stakeholders_db,
         user_manager_name=manager_name,
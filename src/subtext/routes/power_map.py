@@ -16,6 +16,7 @@ from subtext.models import (
     CreatePowerMapRequest,
     CreatePersonRequest,
     CreateRelationshipRequest,
+    batch_time,
 )
 
 router = APIRouter(tags=["power_map"])
@@ -197,42 +198,44 @@ async def upload_people_csv(power_map_id: str, file: UploadFile = File(...)) ->
         added_people = []
         errors = []
 
-        for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 to account for header
-            try:
-                # Validate required fields
-                if not row.get('name') or not row.get('title') or not row.get('department'):
-                    errors.append(f"Row {row_num}: Missing required fields (name, title, department)")
-                    continue
-
-                # Parse influence level with default
-                influence_level = 5
-                if row.get('influence_level'):
-                    try:
-                        influence_level = int(row['influence_level'])
-                        if influence_level < 1 or influence_level > 10:
-                            errors.append(f"Row {row_num}: Influence level must be between 1-10, using default (5)")
-                            influence_level = 5
-                    except ValueError:
-                        errors.append(f"Row {row_num}: Invalid influence level, using default (5)")
-
-                # Create person
-                person = Person(
-                    id=str(uuid.uuid4()),
-                    name=row['name'].strip(),
-                    title=row['title'].strip(),
-                    department=row['department'].strip(),
-                    influence_level=influence_level,
-                    notes=row.get('notes', '').strip() or None,
-                )
-
-                people[person.id] = person
-                power_maps[power_map_id].people.append(person)
-                added_people.append(person)
-
-            except Exception as e:
-                errors.append(f"Row {row_num}: {str(e)}")
-
-        power_maps[power_map_id].updated_at = datetime.now(timezone.utc)
+        # One timestamp for every person created from this upload
+        with batch_time() as now:
+            for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 to account for header
+                try:
+                    # Validate required fields
+                    if not row.get('name') or not row.get('title') or not row.get('department'):
+                        errors.append(f"Row {row_num}: Missing required fields (name, title, department)")
+                        continue
+
+                    # Parse influence level with default
+                    influence_level = 5
+                    if row.get('influence_level'):
+                        try:
+                            influence_level = int(row['influence_level'])
+                            if influence_level < 1 or influence_level > 10:
+                                errors.append(f"Row {row_num}: Influence level must be between 1-10, using default (5)")
+                                influence_level = 5
+                        except ValueError:
+                            errors.append(f"Row {row_num}: Invalid influence level, using default (5)")
+
+                    # Create person
+                    person = Person(
+                        id=str(uuid.uuid4()),
+                        name=row['name'].strip(),
+                        title=row['title'].strip(),
+                        department=row['department'].strip(),
+                        influence_level=influence_level,
+                        notes=row.get('notes', '').strip() or None,
+                    )
+
+                    people[person.id] = person
+                    power_maps[power_map_id].people.append(person)
+                    added_people.append(person)
+
+                except Exception as e:
+                    errors.append(f"Row {row_num}: {str(e)}")
+
+            power_maps[power_map_id].updated_at = now
 
         return {
             "message": f"Successfully added {len(added_people)} people",
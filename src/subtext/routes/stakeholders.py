@@ -5,6 +5,7 @@ Track people in your organization with encrypted notes
 
 from fastapi import APIRouter, HTTPException
 from typing import List
+from collections import defaultdict
 import uuid
 
 from subtext.models import (
@@ -20,6 +21,8 @@ router = APIRouter(tags=["stakeholders"])
 # In-memory storage (will be database later)
 stakeholders: dict[str, Stakeholder] = {}
 interactions: dict[str, InteractionLog] = {}
+# Index of interactions per stakeholder so listing doesn't scan every log
+interactions_by_stakeholder: dict[str, List[InteractionLog]] = defaultdict(list)
 
 
 @router.post("/stakeholders", response_model=Stakeholder)
@@ -101,10 +104,11 @@ async def log_interaction(stakeholder_id: str, request: CreateInteractionRequest
     )
 
     interactions[interaction.id] = interaction
+    interactions_by_stakeholder[stakeholder_id].append(interaction)
     return interaction
 
 
 @router.get("/stakeholders/{stakeholder_id}/interactions", response_model=List[InteractionLog])
 async def list_interactions(stakeholder_id: str) -> List[InteractionLog]:
     """List all interactions for a stakeholder"""
-    return [i for i in interactions.values() if i.stakeholder_id == stakeholder_id]
+    return list(interactions_by_stakeholder.get(stakeholder_id, []))
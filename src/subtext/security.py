@@ -9,19 +9,26 @@ from typing import Optional
 
 # Optional import - gracefully handle if cryptography is not installed
 try:
-    from cryptography.fernet import Fernet
+    from cryptography.exceptions import InvalidTag
+    from cryptography.fernet import Fernet, InvalidToken
     from cryptography.hazmat.primitives import hashes
-    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
     CRYPTO_AVAILABLE = True
 except ImportError:
     CRYPTO_AVAILABLE = False
     print("Warning: cryptography package not installed. Encryption features disabled.")
 
+# Ciphertexts with this prefix are AES-256-GCM; anything else is a legacy Fernet token
+AESGCM_PREFIX = "v2:"
+AESGCM_NONCE_SIZE = 12
+
 
 class EncryptionService:
     """
     Service for encrypting/decrypting sensitive user data
-    Uses Fernet (symmetric encryption) with a master key
+    Uses AES-256-GCM with a key derived from the master key
+    Values written by the older Fernet format can still be decrypted
     """
 
     def __init__(self):
@@ -29,11 +36,32 @@ class EncryptionService:
         if not CRYPTO_AVAILABLE:
             self.master_key = None
             self.fernet = None
+            self.aesgcm = None
+            self.persistent_key = False
             print("⚠️ Encryption service disabled - cryptography package not available")
             return
 
+        # False when the key is a temporary one that changes on every restart / per worker
+        self.persistent_key = bool(os.environ.get("ENCRYPTION_MASTER_KEY"))
         self.master_key = self._get_or_create_master_key()
-        self.fernet = Fernet(self.master_key)
+        self.fernet = Fernet(self.master_key)  # legacy ciphertexts only
+        self.aesgcm = AESGCM(self._derive_aead_key(self.master_key))
+
+    @staticmethod
+    def _derive_aead_key(master_key: bytes) -> bytes:
+        """Derive the AES-GCM key from the Fernet-format master key (done once at startup)"""
+        return HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b"politico-aes-gcm-v2",
+        ).derive(base64.urlsafe_b64decode(master_key))
+
+    def _encrypt_aead(self, plaintext: str) -> str:
+        """AES-GCM encrypt: prefix + urlsafe base64 of nonce || ciphertext+tag"""
+        nonce = os.urandom(AESGCM_NONCE_SIZE)
+        ciphertext = self.aesgcm.encrypt(nonce, plaintext.encode(), None)
+        return AESGCM_PREFIX + base64.urlsafe_b64encode(nonce + ciphertext).decode()
 
     def _get_or_create_master_key(self) -> bytes:
         """
@@ -51,10 +79,10 @@ class EncryptionService:
         else:
             # Generate new key (for development only!)
             # In production, this should be set as environment variable
-            new_key = Fernet.generate_key()
-            print(f"⚠️  WARNING: Generated new encryption key. Set this in environment:")
-            print(f"ENCRYPTION_MASTER_KEY={new_key.decode()}")
-            return new_key
+            # Never log the generated key - logs are not a safe place for secrets
+            print("⚠️  WARNING: ENCRYPTION_MASTER_KEY not set - using a temporary key; "
+                  "encrypted data will not survive a restart")
+            return Fernet.generate_key()
 
     def encrypt(self, plaintext: str) -> str:
         """
@@ -64,13 +92,12 @@ class EncryptionService:
         if not plaintext:
             return ""
 
-        if not CRYPTO_AVAILABLE or not self.fernet:
+        if not CRYPTO_AVAILABLE or not self.aesgcm:
             # Encryption not available - return plaintext with warning marker
             print("⚠️ Encryption not available - storing text unencrypted")
             return f"[UNENCRYPTED]{plaintext}"
 
-        encrypted_bytes = self.fernet.encrypt(plaintext.encode())
-        return base64.b64encode(encrypted_bytes).decode()
+        return self._encrypt_aead(plaintext)
 
     def decrypt(self, encrypted_str: str) -> str:
         """
@@ -84,15 +111,22 @@ class EncryptionService:
         if encrypted_str.startswith("[UNENCRYPTED]"):
             return encrypted_str.replace("[UNENCRYPTED]", "", 1)
 
-        if not CRYPTO_AVAILABLE or not self.fernet:
+        if not CRYPTO_AVAILABLE or not self.aesgcm:
             return "[ENCRYPTED - Cryptography not available]"
 
         try:
+            if encrypted_str.startswith(AESGCM_PREFIX):
+                raw = base64.urlsafe_b64decode(encrypted_str[len(AESGCM_PREFIX):])
+                nonce, ciphertext = raw[:AESGCM_NONCE_SIZE], raw[AESGCM_NONCE_SIZE:]
+                return self.aesgcm.decrypt(nonce, ciphertext, None).decode()
+
+            # Legacy Fernet format
             encrypted_bytes = base64.b64decode(encrypted_str.encode())
             decrypted_bytes = self.fernet.decrypt(encrypted_bytes)
             return decrypted_bytes.decode()
-        except Exception as e:
-            print(f"Decryption error: {e}")
+        except (InvalidTag, InvalidToken, ValueError) as e:
+            # Wrong key, tampered/truncated ciphertext, bad base64 or UTF-8 (both ValueErrors)
+            print(f"Decryption error: {e!r}")
             return "[ENCRYPTED - Cannot decrypt]"
 
 
@@ -29,6 +29,7 @@ LOGGING_FMT = (
 )
 LOGGING_USE_GZIP = True
 UPLOAD_CHUNK_SIZE = 1024 * 64
+OAUTH_TOKEN_DB = os.path.join(DATA_DIR, "oauth_tokens.db")
 IS_TEST = os.getenv("IS_TEST", "0") == "1"
 
 WWW_DIR = os.path.join(PROJECT_ROOT, "www", "dist")
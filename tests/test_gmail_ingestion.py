@@ -0,0 +1,18 @@
+"""
+Address parsing in the Gmail ingestion service
+"""
+
+from subtext.gmail_ingestion import GmailIngestionService
+
+service = GmailIngestionService()
+
+
+def test_bare_address_keeps_rfc5322_local_part() -> None:
+    for address in ["o'brien@x.com", "a!b#c&d*e/f=g?h^i`j{k|l}m~n@x.com"]:
+        assert service._extract_email(address) == address
+        assert service._extract_emails(address) == [address]
+
+
+def test_recipient_prefers_angle_address() -> None:
+    header = '"bob@x.com" <bob.smith@x.com>, "Smith, Dan" <dan@x.com>, o\'brien@x.com'
+    assert service._extract_emails(header) == ["bob.smith@x.com", "dan@x.com", "o'brien@x.com"]